@@ -1,23 +1,63 @@
 from __future__ import annotations
-from typing import Iterable, Union, Tuple, List, Any
+from typing import Iterable, Iterator, Union, Tuple, List, Any, Optional
 from collections.abc import MutableSequence, Sized
-from itertools import zip_longest
+from itertools import chain, zip_longest
+from array import array
+import threading
 
 from ._py_cavalier_contours import lib, ffi
 
 class GeometryError(RuntimeError):
     pass
 
+# Allocator for buffers that are completely overwritten right away, e.g., by
+# a bulk native read; it skips zeroing the memory
+_new_uninitialized = ffi.new_allocator(should_clear_after_alloc=False)
+
+class _Scratch(threading.local):
+    """
+    Preallocated out-parameter cells reused by the native queries. The cells
+    are per-thread since the native calls release the GIL.
+    """
+    def __init__(self) -> None:
+        self.u8 = ffi.new("uint8_t*")
+        self.u32 = ffi.new("uint32_t*")
+        self.i32 = ffi.new("int32_t*")
+        self.f64 = [ffi.new("double*") for _ in range(4)]
+        self.vertex = ffi.new("cavc_vertex*")
+        self.pline = ffi.new("cavc_pline**")
+        self.plinelists = [ffi.new("cavc_plinelist**") for _ in range(2)]
+        self.bool_options = ffi.new("cavc_pline_boolean_o*")
+        lib.cavc_pline_boolean_o_init(self.bool_options)
+
+_scratch = _Scratch()
+
+def _pline_out() -> Any:
+    """
+    Return the per-thread cavc_pline** out-parameter cell reset to NULL, so
+    a failed native call cannot leave a handle owned by another Polyline in it.
+    """
+    cell = _scratch.pline
+    cell[0] = ffi.NULL
+    return cell
+
+# Native functions used in per-vertex paths, bound once to avoid the
+# attribute lookup on lib for every call. Binding happens at import, so only
+# core vertex accessors are bound here.
+_pline_add = lib.cavc_pline_add
+_pline_get_vertex = lib.cavc_pline_get_vertex
+_pline_set_vertex = lib.cavc_pline_set_vertex
+_pline_get_vertex_count = lib.cavc_pline_get_vertex_count
+
 class Vertex:
-    __slots__ = "native",
+    __slots__ = "_x", "_y", "_bulge"
 
     def __init__(self, x: float = 0, y: float = 0, bulge: float = 0) -> None:
         Vertex._validate_bulge(bulge)
 
-        self.native = ffi.new("cavc_vertex*")
-        self.native.x = x
-        self.native.y = y
-        self.native.bulge = bulge
+        self._x = float(x)
+        self._y = float(y)
+        self._bulge = float(bulge)
 
     @staticmethod
     def _validate_bulge(bulge: float) -> None:
@@ -26,32 +66,32 @@ class Vertex:
 
     @property
     def x(self) -> float:
-        return float(self.native.x)
+        return self._x
 
     @x.setter
     def x(self, value: float) -> None:
-        self.native.x = value
+        self._x = float(value)
 
     @property
     def y(self) -> float:
-        return float(self.native.y)
+        return self._y
 
     @y.setter
     def y(self, value: float) -> None:
-        self.native.y = value
+        self._y = float(value)
 
     @property
     def bulge(self) -> float:
-        return float(self.native.bulge)
+        return self._bulge
 
     @bulge.setter
     def bulge(self, value: float) -> None:
         Vertex._validate_bulge(value)
-        self.native.bulge = value
+        self._bulge = float(value)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Vertex):
-            raise NotImplemented
+            return NotImplemented
         return self.x == other.x and self.y == other.y and self.bulge == other.bulge
 
     def __str__(self) -> str:
@@ -61,28 +101,115 @@ class Vertex:
         return f"Vertex({self.x}, {self.y}, {self.bulge})"
 
     def __copy__(self) -> Vertex:
-        return Vertex(self.native.x, self.native.y, self.native.bulge)
+        return Vertex(self._x, self._y, self._bulge)
 
     def __deepcopy__(self, memo: Any) -> Vertex:
         return self.__copy__()
 
 
 class Polyline(MutableSequence[Vertex]):
-    __slots__ = "native",
-
-    def __init__(self, vertices: Iterable[Vertex] = [], closed: bool = True ) -> None:
-        p_native = ffi.new("cavc_pline**")
-        dummy_data = ffi.new("cavc_vertex*", None)
-        lib.cavc_pline_create(dummy_data, 0, closed, p_native)
+    __slots__ = ("native", "_version", "_cached_len", "_cached_length",
+                 "_cached_area", "_cached_bbox", "_cached_vertex_data")
+
+    native: Any
+    _version: int
+    _cached_len: Optional[int]
+    _cached_length: Optional[float]
+    _cached_area: Optional[float]
+    _cached_bbox: Optional[Tuple[float, float, float, float]]
+    _cached_vertex_data: Optional[bytes]
+
+    def __init__(self, vertices: Optional[Iterable[Vertex]] = None, closed: bool = True ) -> None:
+        buffer = Polyline._native_vertices(vertices if vertices is not None else [])
+        p_native = _pline_out()
+        lib.cavc_pline_create(buffer, len(buffer), closed, p_native)
+        if p_native[0] == ffi.NULL:
+            raise GeometryError("Cannot create polyline")
         self.native = p_native[0]
 
-        if isinstance(vertices, Sized):
-            lib.cavc_pline_reserve(self.native, len(vertices))
-        for v in vertices:
-            lib.cavc_pline_add(self.native, v.x, v.y, v.bulge)
+        self._version = 0
+        self._invalidate_cache()
+        self._cached_len = len(buffer)
+
+    @classmethod
+    def circle(cls, cx: float, cy: float, r: float, cw: bool = False) -> Polyline:
+        """
+        Create a closed polyline representing a circle centered at [cx, cy]
+        with radius r. The circle is oriented counter-clockwise unless cw is
+        set.
+        """
+        bulge = -1 if cw else 1
+        vertices = ffi.new("cavc_vertex[]", [(cx - r, cy, bulge), (cx + r, cy, bulge)])
+        p_native = _pline_out()
+        lib.cavc_pline_create(vertices, 2, True, p_native)
+        return cls._from_native(p_native[0])
+
+    @classmethod
+    def from_vertex_data(cls, data: Any, closed: bool = True) -> Polyline:
+        """
+        Create a polyline from a C-contiguous buffer of doubles laid out as
+        [x0, y0, bulge0, x1, y1, bulge1, ...], e.g., the result of
+        vertex_data(), an array.array("d") or a float64 NumPy array of shape
+        (N, 3).
+        """
+        view = memoryview(data)
+        if view.format != "d":
+            raise ValueError("Vertex data have to consist of doubles")
+        buffer = ffi.from_buffer("cavc_vertex[]", data)
+        if ffi.sizeof(buffer) != view.nbytes:
+            raise ValueError("Vertex data have to consist of (x, y, bulge) triples of doubles")
+        bulges = view.cast("B").cast("d")[2::3]
+        if len(bulges) > 0:
+            Vertex._validate_bulge(min(bulges))
+            Vertex._validate_bulge(max(bulges))
+        p_native = _pline_out()
+        lib.cavc_pline_create(buffer, len(buffer), closed, p_native)
+        pline = cls._from_native(p_native[0])
+        pline._cached_len = len(buffer)
+        return pline
+
+    @classmethod
+    def _from_native(cls, native: Any) -> Polyline:
+        """
+        Wrap an owned cavc_pline* handle into a Polyline. The Polyline takes
+        over the ownership of the handle.
+        """
+        if native == ffi.NULL:
+            raise GeometryError("Native call did not produce a polyline")
+        pline = cls.__new__(cls)
+        pline.native = native
+        pline._version = 0
+        pline._invalidate_cache()
+        return pline
+
+    def _invalidate_cache(self, vertex_count_changed: bool = True) -> None:
+        """
+        Drop all lazily computed properties. Has to be called by every method
+        that mutates the polyline. The cached vertex count is kept only if the
+        caller guarantees that the mutation did not change it.
+        """
+        self._version += 1
+        if vertex_count_changed:
+            self._cached_len = None
+        self._cached_length = None
+        self._cached_area = None
+        self._cached_bbox = None
+        self._cached_vertex_data = None
+
+    @property
+    def version(self) -> int:
+        """
+        Mutation counter of the polyline; it changes on every modification.
+        Together with id() it can be used as a key for caching values derived
+        from the polyline.
+        """
+        return self._version
 
     def __del__(self) -> None:
-        lib.cavc_pline_f(self.native)
+        # The handle is missing when __init__ failed to pack the vertices
+        native = getattr(self, "native", None)
+        if native is not None:
+            lib.cavc_pline_f(native)
 
     def __str__(self) -> str:
         return f"Polyline({', '.join([str(x) for x in self])})"
@@ -91,8 +218,14 @@ class Polyline(MutableSequence[Vertex]):
         return f"Polyline({', '.join([str(x) for x in self])})"
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, Polyline):
+            if len(self) != len(other) or self.closed != other.closed:
+                return False
+            return self.vertex_data() == other.vertex_data()
         if not isinstance(other, Iterable):
-            raise NotImplemented
+            return NotImplemented
+        if isinstance(other, Sized) and len(self) != len(other):
+            return False
         return all(l == r for l, r in zip_longest(self, other))
 
     def _ensure_in_range(self, i: int) -> int:
@@ -106,10 +239,21 @@ class Polyline(MutableSequence[Vertex]):
         if isinstance(i, slice):
             raise NotImplementedError("Slices are not supported for getitem")
         else:
-            i = self._ensure_in_range(i)
-            v = Vertex()
-            lib.cavc_pline_get_vertex(self.native, i, v.native)
-            return v
+            return Vertex(*self.vertex_tuple(i))
+
+    def vertex_tuple(self, i: int) -> Tuple[float, float, float]:
+        """
+        Return the i-th vertex as a tuple (x, y, bulge)
+        """
+        i = self._ensure_in_range(i)
+        v = _scratch.vertex
+        _pline_get_vertex(self.native, i, v)
+        return v.x, v.y, v.bulge
+
+    def __iter__(self) -> Iterator[Vertex]:
+        data = self.vertex_data()
+        for i in range(0, len(data), 3):
+            yield Vertex(data[i], data[i + 1], data[i + 2])
 
     def __setitem__(self, i: Union[int, slice], item: Union[Vertex, Iterable[Vertex]]) -> None:
         if isinstance(i, slice):
@@ -118,14 +262,22 @@ class Polyline(MutableSequence[Vertex]):
             i = self._ensure_in_range(i)
             if not isinstance(item, Vertex):
                 raise TypeError("Polyline can only contain vertices")
-            lib.cavc_pline_set_vertex(self.native, i, item.native)
+            v = _scratch.vertex
+            v.x = item.x
+            v.y = item.y
+            v.bulge = item.bulge
+            _pline_set_vertex(self.native, i, v[0])
+            self._invalidate_cache(vertex_count_changed=False)
 
     def __delitem__(self, i: Union[int, slice]) -> None:
         if isinstance(i, slice):
             raise NotImplementedError("Slices are not supported for for setitem")
         else:
             i = self._ensure_in_range(i)
+            count = len(self)
             lib.cavc_pline_remove(self.native, i)
+            self._invalidate_cache(vertex_count_changed=False)
+            self._cached_len = count - 1
 
     def __add__(self, other: Union[Polyline, Iterable[Vertex]]) -> Polyline:
         pline = self.__copy__()
@@ -133,30 +285,41 @@ class Polyline(MutableSequence[Vertex]):
         return pline
 
     def __radd__(self, other: Union[Polyline, Iterable[Vertex]]) -> Polyline:
-        p = Polyline()
-        for v in other:
-            p.append(v)
-        for v in self:
-            p.append(v)
-        return p
+        return Polyline(chain(other, self))
 
     def __iadd__(self, other: Union[Polyline, Iterable[Vertex]]) -> Polyline:
-        for v in other:
-            self.append(v)
+        # Pack the whole operand before touching the native polyline, so an
+        # invalid item leaves the polyline unchanged
+        if isinstance(other, Polyline):
+            tail = other._vertex_buffer()
+        else:
+            tail = Polyline._native_vertices(other)
+        native = self.native
+        lib.cavc_pline_reserve(native, len(tail))
+        for v in tail:
+            _pline_add(native, v.x, v.y, v.bulge)
+        self._invalidate_cache(vertex_count_changed=False)
+        if self._cached_len is not None:
+            self._cached_len += len(tail)
         return self
 
     def __len__(self) -> int:
-        psize = ffi.new("uint32_t*")
-        lib.cavc_pline_get_vertex_count(self.native, psize)
-        return int(psize[0])
+        if self._cached_len is None:
+            psize = _scratch.u32
+            _pline_get_vertex_count(self.native, psize)
+            self._cached_len = int(psize[0])
+        return self._cached_len
 
     def __copy__(self) -> Polyline:
-        pline = self.__class__.__new__(self.__class__)
-
-        p_native = ffi.new("cavc_pline**")
+        p_native = _pline_out()
         lib.cavc_pline_clone(self.native, p_native)
-        pline.native = p_native[0]
+        pline = self._from_native(p_native[0])
 
+        pline._cached_len = self._cached_len
+        pline._cached_length = self._cached_length
+        pline._cached_area = self._cached_area
+        pline._cached_bbox = self._cached_bbox
+        pline._cached_vertex_data = self._cached_vertex_data
         return pline
 
     def __deepcopy__(self, memo: Any) -> Polyline:
@@ -166,49 +329,90 @@ class Polyline(MutableSequence[Vertex]):
         """
         Return length of the polyline
         """
-        l = ffi.new("double*")
-        lib.cavc_pline_eval_path_length(self.native, l)
-        return float(l[0])
+        if self._cached_length is None:
+            l = _scratch.f64[0]
+            lib.cavc_pline_eval_path_length(self.native, l)
+            self._cached_length = float(l[0])
+        return self._cached_length
 
     def area(self) -> float:
         """
         Return area of the polyline
         """
-        a = ffi.new("double*")
-        lib.cavc_pline_eval_path_area(self.native, a)
-        return float(a[0])
+        if self._cached_area is None:
+            a = _scratch.f64[0]
+            lib.cavc_pline_eval_area(self.native, a)
+            self._cached_area = float(a[0])
+        return self._cached_area
 
     def winding_number(self, x: float, y: float) -> int:
         """
         Return winding number
         """
-        wn = ffi.new("int32_t*")
-        lib.cavc_pline_eval_path_area(self.native, x, y, wn)
+        wn = _scratch.i32
+        lib.cavc_pline_eval_wn(self.native, x, y, wn)
         return int(wn[0])
 
+    def winding_numbers(self, points: Iterable[Tuple[float, float]]) -> List[int]:
+        """
+        Return winding numbers of multiple points given as (x, y) pairs
+        """
+        eval_wn = lib.cavc_pline_eval_wn
+        wn = _scratch.i32
+        native = self.native
+        result: List[int] = []
+        for x, y in points:
+            eval_wn(native, x, y, wn)
+            result.append(int(wn[0]))
+        return result
+
+    def winding_numbers_data(self, points: Any) -> array[int]:
+        """
+        Return winding numbers of multiple points given as a C-contiguous
+        buffer of doubles laid out as [x0, y0, x1, y1, ...], e.g., an
+        array.array("d") or a float64 NumPy array of shape (N, 2). The result
+        is an array("i").
+        """
+        coords = ffi.from_buffer("double[]", points)
+        view = memoryview(points)
+        if view.format != "d" or ffi.sizeof(coords) != view.nbytes or len(coords) % 2:
+            raise ValueError("Points have to consist of (x, y) pairs of doubles")
+        count = len(coords) // 2
+        result = array("i", bytes(4 * count))
+        out = ffi.from_buffer("int32_t[]", result)
+        eval_wn = lib.cavc_pline_eval_wn
+        native = self.native
+        for i in range(count):
+            eval_wn(native, coords[2 * i], coords[2 * i + 1], out + i)
+        return result
+
     def reverse(self) -> None:
         """
         Reverse the direction
         """
         lib.cavc_pline_invert_direction(self.native)
+        self._invalidate_cache(vertex_count_changed=False)
 
     def scale(self, factor: float) -> None:
         """
         Scale the polyline around [0, 0]
         """
         lib.cavc_pline_scale(self.native, factor)
+        self._invalidate_cache(vertex_count_changed=False)
 
     def translate(self, x: float, y: float) -> None:
         """
         Translate the polyline
         """
         lib.cavc_pline_translate(self.native, x, y)
+        self._invalidate_cache(vertex_count_changed=False)
 
     def remove_repeated(self, eps: float = 1e-5) -> None:
         """
         Remove repeated vertices
         """
         lib.cavc_pline_remove_repeated_pos(self.native, eps)
+        self._invalidate_cache()
 
     def remove_redundant(self, eps: float = 1e-5) -> None:
         """
@@ -219,18 +423,24 @@ class Polyline(MutableSequence[Vertex]):
         angle less than or equal to PI.
         """
         lib.cavc_pline_remove_redundant(self.native, eps)
+        self._invalidate_cache()
 
     def clear(self) -> None:
         """
         Clear all polygons
         """
         lib.cavc_pline_clear(self.native)
+        self._invalidate_cache(vertex_count_changed=False)
+        self._cached_len = 0
 
     def append(self, v: Vertex) -> None:
         """
         Append a vertex to the end of the list
         """
-        lib.cavc_pline_add(self.native, v.x, v.y, v.bulge)
+        _pline_add(self.native, v.x, v.y, v.bulge)
+        self._invalidate_cache(vertex_count_changed=False)
+        if self._cached_len is not None:
+            self._cached_len += 1
 
     def insert(self, index: int, v: Vertex) -> None:
         """
@@ -244,28 +454,68 @@ class Polyline(MutableSequence[Vertex]):
         """
         lib.cavc_pline_reserve(self.native, additional)
 
+    def _vertex_buffer(self) -> Any:
+        """
+        Read all vertices into a freshly allocated cavc_vertex[]
+        """
+        buffer = _new_uninitialized("cavc_vertex[]", len(self))
+        lib.cavc_pline_get_vertex_data(self.native, buffer)
+        return buffer
+
+    @staticmethod
+    def _native_vertices(vertices: Iterable[Vertex]) -> Any:
+        """
+        Pack vertices into a contiguous cavc_vertex[] suitable for bulk native
+        calls.
+        """
+        return ffi.new("cavc_vertex[]", [(v.x, v.y, v.bulge) for v in vertices])
+
+    def set_vertices(self, vertices: Union[Polyline, Iterable[Vertex]]) -> None:
+        """
+        Replace all vertices of the polyline by the given vertices or by the
+        vertices of the given polyline
+        """
+        if isinstance(vertices, Polyline):
+            buffer = vertices._vertex_buffer()
+        else:
+            buffer = Polyline._native_vertices(vertices)
+        lib.cavc_pline_set_vertex_data(self.native, buffer, len(buffer))
+        self._invalidate_cache(vertex_count_changed=False)
+        self._cached_len = len(buffer)
+
+    def vertex_data(self) -> memoryview[float]:
+        """
+        Return all vertices as a flat read-only memoryview of doubles laid out
+        as [x0, y0, bulge0, x1, y1, bulge1, ...]. The view supports the buffer
+        protocol, e.g., use `numpy.asarray(p.vertex_data()).reshape(-1, 3)` to
+        get a NumPy array.
+        """
+        if self._cached_vertex_data is None:
+            self._cached_vertex_data = ffi.buffer(self._vertex_buffer())[:]
+        return memoryview(self._cached_vertex_data).cast("d")
+
     def bounding_box(self) -> Tuple[float, float, float, float]:
         """
         Compute bounding box and return it as (minx, miny, maxx, maxy)
         """
-        minx = ffi.new("float*")
-        miny = ffi.new("float*")
-        maxx = ffi.new("float*")
-        maxy = ffi.new("float*")
-        retval = lib.cavc_pline_eval_extents(self.native, minx, miny, maxx, maxy)
-        if retval == 2:
-            raise GeometryError("Cannot evaluate bounding box on less than 1 vertice")
-        return minx[0], miny[0], maxx[0], maxy[0]
+        if self._cached_bbox is None:
+            minx, miny, maxx, maxy = _scratch.f64
+            retval = lib.cavc_pline_eval_extents(self.native, minx, miny, maxx, maxy)
+            if retval == 2:
+                raise GeometryError("Cannot evaluate bounding box on less than 1 vertice")
+            self._cached_bbox = minx[0], miny[0], maxx[0], maxy[0]
+        return self._cached_bbox
 
     @property
     def closed(self) -> bool:
-        c = ffi.new("uint8_t*")
+        c = _scratch.u8
         lib.cavc_pline_get_is_closed(self.native, c)
         return bool(c[0])
 
     @closed.setter
     def closed(self, value: bool) -> None:
         lib.cavc_pline_set_is_closed(self.native, value)
+        self._invalidate_cache(vertex_count_changed=False)
 
     @staticmethod
     def _pythonizePlist(list_handle: Any) -> List[Polyline]:
@@ -273,16 +523,18 @@ class Polyline(MutableSequence[Vertex]):
         Given a cavc_pline* handle, turn it into a Python list of Polylines and
         free the original native list.
         """
-        count = ffi.new("uint32_t*")
-        lib.cavc_plinelist_get_count(list_handle, count)
+        if list_handle == ffi.NULL:
+            raise GeometryError("Native call did not produce a polyline list")
         result: List[Polyline] = []
-        for i in range(count[0]):
-            p_native = ffi.new("cavc_pline **")
-            lib.cavc_plinelist_take(list_handle, i, p_native)
-            polyline = Polyline.__new__(Polyline)
-            polyline.native = p_native[0]
-            result.append(polyline)
-        lib.cavc_plinelist_f(list_handle)
+        try:
+            count = _scratch.u32
+            lib.cavc_plinelist_get_count(list_handle, count)
+            for i in range(count[0]):
+                p_native = _pline_out()
+                lib.cavc_plinelist_take(list_handle, i, p_native)
+                result.append(Polyline._from_native(p_native[0]))
+        finally:
+            lib.cavc_plinelist_f(list_handle)
         return result
 
 
@@ -292,6 +544,22 @@ class Polyline(MutableSequence[Vertex]):
         """
         Compute offset.
         """
+        return self.offsets([distance], handle_self_intersects, pos_equal_eps,
+                            slice_join_eps, offset_dist_eps)[0]
+
+    def offsets(self, distances: Iterable[float], handle_self_intersects: bool = True,
+        pos_equal_eps: float = 1e-5, slice_join_eps: float = 1e-5,
+        offset_dist_eps: float = 1e-5) -> List[List[Polyline]]:
+        """
+        Compute offsets for multiple distances, e.g., concentric offsets.
+        Returns a list of results, one per distance.
+
+        When handle_self_intersects is False (i.e., the polyline is promised
+        to be simple), inward offsets that certainly collapse the polyline
+        return an empty result without invoking the native offset.
+        """
+        limit = None if handle_self_intersects else self._collapsing_offset_limit()
+
         options = ffi.new("cavc_pline_parallel_offset_o*")
         lib.cavc_pline_parallel_offset_o_init(options)
         options.pos_equal_eps = pos_equal_eps
@@ -300,20 +568,58 @@ class Polyline(MutableSequence[Vertex]):
         options.handle_self_intersects = handle_self_intersects
 
         result = ffi.new("cavc_plinelist**")
-        lib.cavc_pline_parallel_offset(self.native, distance, options, result)
-        return Polyline._pythonizePlist(result[0])
+        offsets: List[List[Polyline]] = []
+        for distance in distances:
+            if limit is not None and distance / limit > 1:
+                offsets.append([])
+                continue
+            result[0] = ffi.NULL
+            lib.cavc_pline_parallel_offset(self.native, distance, options, result)
+            offsets.append(Polyline._pythonizePlist(result[0]))
+        return offsets
+
+    def _collapsing_offset_limit(self) -> Optional[float]:
+        """
+        Return the signed offset distance beyond which the offset of a simple
+        closed polyline is certainly empty, or None if no such bound is known.
+        No point inside the polyline is further from its boundary than half of
+        the shorter side of its bounding box.
+        """
+        if not self.closed or len(self) < 2:
+            return None
+        area = self.area()
+        if area == 0:
+            return None
+        minx, miny, maxx, maxy = self.bounding_box()
+        limit = min(maxx - minx, maxy - miny) / 2
+        # Positive offsets shrink counter-clockwise (positive area) polylines
+        return limit if area > 0 else -limit
 
     def _bool_op(self, other: Polyline, op: int, pos_equal_eps: float,
                  slice_join_eps: float) -> Tuple[List[Polyline], List[Polyline]]:
-        options = ffi.new("cavc_pline_parallel_offset_o*")
-        lib.cavc_pline_boolean_o_init(options)
+        options = _scratch.bool_options
         options.pos_equal_eps = pos_equal_eps
         options.slice_join_eps = slice_join_eps
 
-        pos_result = ffi.new("cavc_plinelist**")
-        neg_result = ffi.new("cavc_plinelist**")
-        lib.cavc_pline_boolean(self.native, other.native, 0, pos_result, neg_result)
-        return Polyline._pythonizePlist(pos_result), Polyline._pythonizePlist(neg_result)
+        pos_result, neg_result = _scratch.plinelists
+        pos_result[0] = neg_result[0] = ffi.NULL
+        lib.cavc_pline_boolean(self.native, other.native, op, options,
+                               pos_result, neg_result)
+        pos_list, neg_list = pos_result[0], neg_result[0]
+        return Polyline._pythonizePlist(pos_list), Polyline._pythonizePlist(neg_list)
+
+    def _bounding_boxes_disjoint(self, other: Polyline, eps: float) -> bool:
+        """
+        Cheap probe preceding the boolean operations: return True when the
+        bounding boxes of the polylines are apart by more than eps, hence the
+        polylines cannot overlap.
+        """
+        if len(self) < 2 or len(other) < 2:
+            return False
+        aminx, aminy, amaxx, amaxy = self.bounding_box()
+        bminx, bminy, bmaxx, bmaxy = other.bounding_box()
+        return (amaxx + eps < bminx or bmaxx + eps < aminx or
+                amaxy + eps < bminy or bmaxy + eps < aminy)
 
     def union(self, other: Polyline, pos_equal_eps: float = 1e-5,
               slice_join_eps: float = 1e-5) -> Tuple[List[Polyline], List[Polyline]]:
@@ -331,6 +637,8 @@ class Polyline(MutableSequence[Vertex]):
         polylines (outlines) and negative polylines (holes). Does not modify the
         original polylines.
         """
+        if self._bounding_boxes_disjoint(other, pos_equal_eps):
+            return [], []
         return self._bool_op(other, 1, pos_equal_eps, slice_join_eps)
 
     def difference(self, other: Polyline, pos_equal_eps: float = 1e-5,
@@ -0,0 +1,42 @@
+from copy import copy
+from functools import lru_cache
+from typing import Callable
+from py_cavalier_contours import Vertex, Polyline
+import pytest
+
+
+@pytest.fixture(scope="session")
+def square_factory() -> Callable[..., Polyline]:
+    """
+    Return a function making an axis-aligned square of the given size with
+    the lower left corner at (x, y). The squares are shared prototypes, so
+    tests have to copy them before mutation.
+    """
+    @lru_cache(maxsize=None)
+    def make(x: float, y: float, size: float, ccw: bool = True) -> Polyline:
+        vertices = [Vertex(x, y), Vertex(x + size, y),
+                    Vertex(x + size, y + size), Vertex(x, y + size)]
+        if not ccw:
+            vertices.reverse()
+        return Polyline(vertices)
+    return make
+
+@pytest.fixture(scope="session")
+def unit_square_proto(square_factory: Callable[..., Polyline]) -> Polyline:
+    """
+    Shared counter-clockwise unit square. Tests must not mutate it; request
+    unit_square to get a private copy.
+    """
+    return square_factory(0, 0, 1)
+
+@pytest.fixture
+def unit_square(unit_square_proto: Polyline) -> Polyline:
+    return copy(unit_square_proto)
+
+@pytest.fixture(scope="session")
+def circle_proto() -> Polyline:
+    """
+    Shared counter-clockwise circle of radius 3 centered at (1, 2). Tests must
+    not mutate it.
+    """
+    return Polyline.circle(1, 2, 3)
@@ -0,0 +1,311 @@
+import gc
+import math
+from array import array
+from contextlib import nullcontext
+from copy import copy, deepcopy
+from py_cavalier_contours import Vertex, Polyline
+import pytest
+
+
+def signed_total_area(pos, neg):
+    """
+    Total area of a boolean operation result: outlines minus holes
+    """
+    return sum(abs(p.area()) for p in pos) - sum(abs(p.area()) for p in neg)
+
+def test_polyline_length_area(unit_square):
+    p = unit_square
+    assert p.length() == 4
+    assert p.area() == 1
+
+    # Repeated queries are served from the cache and mutation invalidates it
+    assert p.length() == 4
+    p.scale(2)
+    assert p.length() == 8
+    assert p.area() == 4
+
+    p.closed = False
+    assert p.length() == 6
+    assert p.area() == 0
+
+    p.append(Vertex(0, 0))
+    assert p.length() == 8
+
+    del p[-1]
+    p[0] = Vertex(2, 0)
+    assert p.length() == 4
+
+def test_polyline_vertex_data(unit_square):
+    p = unit_square
+    p[2] = Vertex(1, 1, 0.5)
+    assert p.vertex_data().tolist() == [0, 0, 0, 1, 0, 0, 1, 1, 0.5, 0, 1, 0]
+    assert len(Polyline().vertex_data()) == 0
+
+    data = p.vertex_data()
+    assert data.readonly
+    data.release()
+    assert p.vertex_data().tolist() == [0, 0, 0, 1, 0, 0, 1, 1, 0.5, 0, 1, 0]
+    assert list(p)[2] == Vertex(1, 1, 0.5)
+    with p.vertex_data():
+        pass
+    assert copy(p) == p
+
+    data = p.vertex_data()
+    p.translate(1, 0)
+    assert p.vertex_data()[0] == 1
+    assert data[0] == 0
+
+def test_polyline_set_vertices(unit_square_proto, unit_square):
+    p = unit_square
+    assert p.length() == 4
+    p.set_vertices([Vertex(0, 0), Vertex(2, 0), Vertex(2, 2)])
+    assert len(p) == 3
+    assert p[1] == Vertex(2, 0)
+    assert p.closed
+    assert p.length() == pytest.approx(4 + 8 ** 0.5)
+
+    p.set_vertices(unit_square_proto)
+    assert len(p) == 4
+    assert p.length() == 4
+
+def test_polyline_intersect(unit_square_proto, square_factory):
+    a = unit_square_proto
+    pos, neg = a.intersect(square_factory(0.5, 0, 1))
+    assert neg == []
+    assert signed_total_area(pos, neg) == pytest.approx(0.5)
+
+    pos, neg = a.union(square_factory(0.5, 0, 1))
+    assert signed_total_area(pos, neg) == pytest.approx(1.5)
+
+    assert a.intersect(square_factory(2.5, 0, 1)) == ([], [])
+
+def test_polyline_bounding_box(unit_square):
+    p = unit_square
+    assert p.bounding_box() == (0, 0, 1, 1)
+    p.translate(10, 20)
+    assert p.bounding_box() == (10, 20, 11, 21)
+    p.append(Vertex(15, 25))
+    assert p.bounding_box() == (10, 20, 15, 25)
+
+def test_polyline_offsets(square_factory):
+    p = square_factory(0, 0, 10)
+    results = p.offsets([1, 2, 3])
+    assert [len(result) for result in results] == [1, 1, 1]
+    assert [abs(result[0].area()) for result in results] == pytest.approx([64, 36, 16])
+    assert len(p.offsets([])) == 0
+
+def test_polyline_winding_numbers(unit_square):
+    p = unit_square
+    assert p.winding_number(0.5, 0.5) == 1
+    assert p.winding_number(2, 2) == 0
+    assert p.winding_numbers([(0.5, 0.5), (2, 2), (-1, 0.5)]) == [1, 0, 0]
+    p.reverse()
+    assert p.winding_numbers([(0.5, 0.5)]) == [-1]
+    assert p.winding_numbers([]) == []
+
+def test_polyline_winding_numbers_data(unit_square_proto):
+    p = unit_square_proto
+    points = array("d", [0.5, 0.5, 2, 2, -1, 0.5])
+    assert list(p.winding_numbers_data(points)) == [1, 0, 0]
+    assert list(p.winding_numbers_data(array("d"))) == []
+    with pytest.raises(ValueError):
+        p.winding_numbers_data(array("d", [0.5, 0.5, 2]))
+    with pytest.raises(ValueError):
+        p.winding_numbers_data(array("f", [0.5, 0.5]))
+
+def test_polyline_collapsing_offsets(square_factory):
+    p = square_factory(0, 0, 10)
+    inward, outward = p.offsets([6, -6], handle_self_intersects=False)
+    assert inward == []
+    assert len(outward) == 1
+    assert abs(outward[0].area()) > 100
+
+    p = square_factory(0, 0, 10, ccw=False)
+    assert p.offsets([-6], handle_self_intersects=False) == [[]]
+
+def test_polyline_len(unit_square):
+    p = unit_square
+    assert len(p) == 4
+    p.translate(1, 1)
+    assert len(p) == 4
+    p.append(Vertex(3, 3))
+    assert len(p) == 5
+    del p[0]
+    assert len(p) == 4
+    p.remove_repeated()
+    assert len(p) == 4
+    p.clear()
+    assert len(p) == 0
+
+def test_polyline_circle(circle_proto):
+    c = circle_proto
+    assert len(c) == 2
+    assert c.closed
+    assert c.area() == pytest.approx(math.pi * 9)
+    assert c.length() == pytest.approx(math.pi * 6)
+    assert c.bounding_box() == pytest.approx((-2, -1, 4, 5))
+
+    assert Polyline.circle(1, 2, 3, cw=True).area() == pytest.approx(-math.pi * 9)
+
+def test_polyline_iteration(unit_square):
+    p = unit_square
+    p[1] = Vertex(1, 0, 0.5)
+    assert list(p) == [Vertex(0, 0), Vertex(1, 0, 0.5), Vertex(1, 1), Vertex(0, 1)]
+    assert Vertex(1, 1) in p
+    assert list(Polyline()) == []
+
+def test_polyline_eq(unit_square_proto, unit_square):
+    p = unit_square_proto
+    assert p == unit_square
+    assert p == [Vertex(0, 0), Vertex(1, 0), Vertex(1, 1), Vertex(0, 1)]
+    assert p != [Vertex(0, 0), Vertex(1, 0), Vertex(1, 1)]
+    assert p != Polyline(list(p), closed=False)
+
+    q = unit_square
+    q[2] = Vertex(1, 1, 0.5)
+    assert p != q
+    q.append(Vertex(2, 2))
+    assert p != q
+
+def test_polyline_version(unit_square):
+    p = unit_square
+    version = p.version
+    p.length()
+    p.bounding_box()
+    assert p.version == version
+    p.translate(1, 0)
+    assert p.version != version
+    version = p.version
+    p.closed = False
+    assert p.version != version
+
+def test_polyline_construction():
+    p = Polyline()
+    assert len(p) == 0
+    assert p.closed
+    p.append(Vertex(1, 1))
+    assert len(Polyline()) == 0
+
+    p = Polyline((Vertex(i, 0) for i in range(3)), closed=False)
+    assert len(p) == 3
+    assert not p.closed
+    assert p[-1] == Vertex(2, 0)
+
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+def test_polyline_construction_invalid():
+    # The partially constructed polyline must be collected without errors
+    with pytest.raises(AttributeError):
+        Polyline([Vertex(0, 0), 3])
+    gc.collect()
+
+@pytest.mark.parametrize("vertices, closed", [
+    ([], True),
+    ([], False),
+    ([Vertex(0, 0), Vertex(1, 0)], False),
+    ([Vertex(0, 0), Vertex(1, 0, 0.5), Vertex(1, 1)], True),
+])
+def test_polyline_construction_from_vertices(vertices, closed):
+    p = Polyline(vertices, closed=closed)
+    assert len(p) == len(vertices)
+    assert p.closed is closed
+    assert list(p) == vertices
+
+@pytest.mark.parametrize("index, expected", [
+    (0, Vertex(0, 0)),
+    (2, Vertex(1, 1)),
+    (-1, Vertex(0, 1)),
+    (-4, Vertex(0, 0)),
+    (4, IndexError),
+    (-5, IndexError),
+])
+def test_polyline_getitem(unit_square_proto, index, expected):
+    if expected is IndexError:
+        context = pytest.raises(IndexError)
+    else:
+        context = nullcontext()
+    with context:
+        assert unit_square_proto[index] == expected
+
+def test_polyline_concatenation(unit_square_proto, unit_square):
+    p = unit_square
+    p += [Vertex(2, 2), Vertex(3, 3)]
+    assert len(p) == 6
+    assert p[-1] == Vertex(3, 3)
+
+    p += p
+    assert len(p) == 12
+    data = p.vertex_data()
+    assert data[18:] == data[:18]
+
+    q = [Vertex(-1, -1)] + unit_square_proto
+    assert len(q) == 5
+    assert q[0] == Vertex(-1, -1)
+    assert q[1] == Vertex(0, 0)
+
+    r = unit_square_proto + [Vertex(5, 5)]
+    assert len(r) == 5
+    assert r[-1] == Vertex(5, 5)
+
+    s = unit_square_proto + Polyline([Vertex(5, 5, 0.5)])
+    assert len(s) == 5
+    assert s[-1] == Vertex(5, 5, 0.5)
+    assert s.closed
+
+def test_polyline_concatenation_invalid(unit_square_proto, unit_square):
+    p = unit_square
+    area = p.area()
+    bounding_box = p.bounding_box()
+
+    def vertices():
+        yield Vertex(5, 5)
+        raise RuntimeError("Source failed")
+
+    with pytest.raises(AttributeError):
+        p += [Vertex(5, 5), None]
+    with pytest.raises(RuntimeError):
+        p += vertices()
+    assert len(p) == 4
+    assert p == unit_square_proto
+    assert p.area() == area
+    assert p.bounding_box() == bounding_box
+
+def test_polyline_from_vertex_data(unit_square):
+    p = unit_square
+    p[0] = Vertex(0, 0, -0.5)
+    q = Polyline.from_vertex_data(p.vertex_data())
+    assert q == p
+
+    r = Polyline.from_vertex_data(array("d", [0, 0, 0, 2, 0, 1]), closed=False)
+    assert r.vertex_data().tolist() == [0, 0, 0, 2, 0, 1]
+    assert not r.closed
+
+    with pytest.raises(ValueError):
+        Polyline.from_vertex_data(array("d", [0, 0, 0, 2]))
+    with pytest.raises(ValueError):
+        Polyline.from_vertex_data(array("f", [1, 2, 3, 4, 5, 6]))
+    with pytest.raises(ValueError):
+        Polyline.from_vertex_data(array("q", [0, 0, 0]))
+    with pytest.raises(ValueError):
+        Polyline.from_vertex_data(array("d", [0, 0, 5, 1, 1, 0]))
+    with pytest.raises(ValueError):
+        Polyline.from_vertex_data(array("d", [0, 0, 0, 1, 1, -1.5]))
+
+def test_polyline_vertex_tuple(unit_square):
+    p = unit_square
+    p[1] = Vertex(1, 0, -0.25)
+    assert p.vertex_tuple(1) == (1, 0, -0.25)
+    assert p.vertex_tuple(-1) == (0, 1, 0)
+    with pytest.raises(IndexError):
+        p.vertex_tuple(4)
+
+@pytest.mark.parametrize("copy_fn", [copy, deepcopy])
+def test_polyline_copy(unit_square_proto, copy_fn):
+    p = copy_fn(unit_square_proto)
+    assert p == unit_square_proto
+    assert p.native != unit_square_proto.native
+
+    p[0] = Vertex(-1, -1)
+    p.closed = False
+    assert p != unit_square_proto
+    assert unit_square_proto[0] == Vertex(0, 0)
+    assert unit_square_proto.closed